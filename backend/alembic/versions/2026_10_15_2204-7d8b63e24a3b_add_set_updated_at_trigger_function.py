@@ -0,0 +1,43 @@
+"""add set_updated_at trigger function
+
+Revision ID: 7d8b63e24a3b
+Revises:
+Create Date: 2026-10-15 22:04:02.626733
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7d8b63e24a3b"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Shared trigger function that stamps ``updated_at`` on every UPDATE, so the
+    ORM doesn't need ``onupdate=``. Attach it per table in that table's migration:
+
+        CREATE TRIGGER trg_<table>_updated_at BEFORE UPDATE ON <table>
+        FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+    """
+    op.execute(
+        """
+        CREATE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at := clock_timestamp();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION set_updated_at()")
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,14 +19,23 @@ class Settings(BaseSettings):
 
     # Connection pool settings (see docs/database.md for details)
     # These tune how SQLAlchemy manages database connections.
-    db_pool_size: int = 5  # Number of persistent connections to keep open
-    db_max_overflow: int = 10  # Extra connections allowed beyond pool_size under load
-    db_pool_timeout: int = 30  # Seconds to wait for available connection before error
+    db_pool_size: int = 20  # Number of persistent connections to keep open
+    db_max_overflow: int = 20  # Extra connections allowed beyond pool_size under load
+    db_pool_timeout: int = 5  # Seconds to wait for available connection before error
     db_pool_recycle: int = 3600  # Recreate connections older than this (seconds)
     db_pool_pre_ping: bool = True  # Test connection with SELECT 1 before using
     db_echo: bool = False  # Log all SQL statements (True for debugging)
     db_statement_timeout: int = 30  # Max seconds for a query before it's killed
 
+    # Prepared statement caches (per connection). Set both to 0 behind pgbouncer in
+    # transaction mode — prepared statements don't survive a server connection swap.
+    db_statement_cache_size: int = 1024  # asyncpg's own LRU of prepared statements
+    db_prepared_statement_cache_size: int = 256  # SQLAlchemy's asyncpg adapter cache
+
+    # Decode Postgres numeric (Numeric columns, AVG/SUM results) to float instead of
+    # Decimal. Faster per row; set False if any Numeric column needs exact arithmetic.
+    db_numeric_as_float: bool = True
+
     model_config = SettingsConfigDict(
         env_file=".env",  # Load from .env in development
         env_file_encoding="utf-8",
@@ -32,4 +43,13 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, parsed from env vars and .env only once.
+
+    Also usable as a FastAPI dependency: ``Annotated[Settings, Depends(get_settings)]``.
+    """
+    return Settings()
+
+
+settings = get_settings()
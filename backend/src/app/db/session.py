@@ -1,8 +1,16 @@
 from collections.abc import AsyncGenerator
-
-from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from typing import Any
+
+from sqlalchemy import Connection, MetaData, Table, event, text
+from sqlalchemy.engine import AdaptedConnection
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
@@ -31,26 +39,110 @@ class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=NAMING_CONVENTION)
 
 
+# Same function as migration 7d8b63e24a3b. Production schema comes from Alembic;
+# these listeners give schemas built with Base.metadata.create_all() (the test
+# suite) the same trigger-maintained updated_at.
+_SET_UPDATED_AT_FUNCTION = text(
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+    BEGIN
+        NEW.updated_at := clock_timestamp();
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """
+)
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_set_updated_at(_target: MetaData, connection: Connection, **_kw: Any) -> None:
+    """Install set_updated_at() before create_all() creates any table."""
+    connection.execute(_SET_UPDATED_AT_FUNCTION)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _attach_updated_at_triggers(
+    _target: MetaData, connection: Connection, tables: list[Table], **_kw: Any
+) -> None:
+    """Attach set_updated_at() to every table create_all() just created with updated_at."""
+    # Quote like SQLAlchemy does for CREATE TABLE — reserved words ("order", "user"),
+    # mixed case, and schema-qualified tables all need it
+    preparer = connection.dialect.identifier_preparer
+    for table in tables:
+        if "updated_at" in table.c:
+            trigger = preparer.quote(f"trg_{table.name}_updated_at")
+            connection.execute(
+                text(
+                    f"CREATE TRIGGER {trigger} BEFORE UPDATE ON {preparer.format_table(table)} "
+                    "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+                )
+            )
+
+
+@event.listens_for(Base.metadata, "after_drop")
+def _drop_set_updated_at(_target: MetaData, connection: Connection, **_kw: Any) -> None:
+    """Remove set_updated_at() once drop_all() has dropped the tables using it."""
+    connection.execute(text("DROP FUNCTION IF EXISTS set_updated_at()"))
+
+
 # Async engine with connection pooling.
 # The engine manages a pool of database connections that are reused across requests.
 engine = create_async_engine(
     settings.database_url,
     # Pool configuration — see docs/database.md for detailed explanation
+    poolclass=AsyncAdaptedQueuePool,  # The async default, stated explicitly
+    pool_use_lifo=True,  # Reuse the most recently returned (warmest) connection
     pool_size=settings.db_pool_size,  # Persistent connections
     max_overflow=settings.db_max_overflow,  # Extra connections under load
     pool_timeout=settings.db_pool_timeout,  # Wait time for available connection
     pool_recycle=settings.db_pool_recycle,  # Max connection age (prevents stale connections)
     pool_pre_ping=settings.db_pool_pre_ping,  # Test connection before checkout
     echo=settings.db_echo,  # SQL logging
-    # asyncpg driver options — passed directly to asyncpg.connect()
-    connect_args={"command_timeout": settings.db_statement_timeout},  # Kill slow queries
+    # asyncpg driver options — passed to asyncpg.connect() via SQLAlchemy's adapter
+    connect_args={
+        "command_timeout": settings.db_statement_timeout,  # Kill slow queries
+        "statement_cache_size": settings.db_statement_cache_size,  # Reuse parsed SQL
+        "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+    },
 )
 
+
+def _set_type_codecs(dbapi_connection: AdaptedConnection, _record: object) -> None:
+    """Decode Postgres numeric to float on each new pooled connection.
+
+    asyncpg returns numeric as Decimal by default — a Python object built per
+    value, per row. Registering a codec once per connection hands back floats
+    instead. Runs on connect, so the cost is paid once, not per query.
+    """
+    dbapi_connection.run_async(
+        lambda conn: conn.set_type_codec(
+            "numeric", encoder=str, decoder=float, schema="pg_catalog", format="text"
+        )
+    )
+
+
+def register_type_codecs(target: AsyncEngine) -> None:
+    """Apply the app's asyncpg type codecs to every new connection of ``target``.
+
+    Any engine that runs app queries needs this — including the test engine —
+    or it decodes numeric differently from production.
+    """
+    if settings.db_numeric_as_float:
+        event.listen(target.sync_engine, "connect", _set_type_codecs)
+
+
+register_type_codecs(engine)
+
 # Session factory — creates AsyncSession instances.
 # expire_on_commit=False keeps objects usable after commit without re-querying.
 # This is important for async because accessing expired attributes would trigger sync I/O.
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
+# Read-only session factory — shares the engine's pool, but connections run in
+# AUTOCOMMIT mode, so asyncpg sends no BEGIN/COMMIT around read-only requests.
+readonly_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+async_readonly_session = async_sessionmaker(readonly_engine, expire_on_commit=False)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that provides a database session per request.
@@ -74,6 +166,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+async def get_db_readonly() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that provides an autocommit session for read-only requests.
+
+    Each statement runs on its own — no transaction is opened, so there is no
+    BEGIN/COMMIT round-trip. Only use it for endpoints that never write; writes
+    made through this session would be committed immediately, one statement at
+    a time, with no rollback on error.
+
+    Usage in endpoints:
+        @app.get("/users")
+        async def get_users(db: AsyncSession = Depends(get_db_readonly)):
+            result = await db.execute(select(User))
+            return result.scalars().all()
+    """
+    async with async_readonly_session() as session:
+        yield session
+
+
 async def shutdown() -> None:
     """Graceful shutdown — close all pooled database connections.
 
@@ -10,6 +10,10 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_db, get_db_readonly
 
+# Read-write session — one transaction per request, committed on success.
 DB = Annotated[AsyncSession, Depends(get_db)]
+
+# Read-only session — autocommit, no transaction. Use on GET endpoints that never write.
+ReadDB = Annotated[AsyncSession, Depends(get_db_readonly)]
@@ -8,23 +8,23 @@ via structlog.contextvars.
 import logging
 import logging.config
 import sys
-from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
+import orjson
 import structlog
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from structlog.stdlib import BoundLogger
 
 
-def _add_timestamp(
-    _logger: object,
-    _method_name: str,
-    event_dict: dict[str, Any],
-) -> dict[str, Any]:
-    """Add ISO 8601 UTC timestamp with timezone offset."""
-    event_dict["timestamp"] = datetime.now(UTC).isoformat()
-    return event_dict
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson.
+
+    Returns str, not bytes — stdlib logging handlers write text. Non-string
+    dict keys (e.g. ``{1: "x"}``) are allowed instead of raising.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
 
 
 class LoggingSettings(BaseSettings):
@@ -38,6 +38,12 @@ class LoggingSettings(BaseSettings):
     )
 
 
+@lru_cache(maxsize=1)
+def get_logging_settings() -> LoggingSettings:
+    """Return the process-wide LoggingSettings, parsed from the environment only once."""
+    return LoggingSettings()
+
+
 def configure_logging(settings: LoggingSettings) -> None:
     """Configure structlog with JSON output to stdout.
 
@@ -49,10 +55,14 @@ def configure_logging(settings: LoggingSettings) -> None:
         structlog.contextvars.merge_contextvars,  # Auto-include bound context
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
-        _add_timestamp,
+        structlog.processors.TimeStamper(fmt="iso", utc=True, key="timestamp"),
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
+        # Tracebacks as a list of frame dicts, so log aggregators can query them.
+        # show_locals=False: local variables can hold secrets and are slow to repr.
+        structlog.processors.ExceptionRenderer(
+            structlog.tracebacks.ExceptionDictTransformer(show_locals=False)
+        ),
     ]
 
     structlog.configure(
@@ -73,7 +83,7 @@ def configure_logging(settings: LoggingSettings) -> None:
             "formatters": {
                 "json": {
                     "()": structlog.stdlib.ProcessorFormatter,
-                    "processor": structlog.processors.JSONRenderer(),
+                    "processor": structlog.processors.JSONRenderer(serializer=_orjson_dumps),
                     "foreign_pre_chain": processors,
                 },
             },
@@ -95,9 +105,11 @@ def configure_logging(settings: LoggingSettings) -> None:
     )
 
 
-# Configure once at module import
-_settings = LoggingSettings()
-configure_logging(_settings)
+# Configure once per process. structlog's configuration is process-global, so this
+# also skips re-running dictConfig (which tears down and rebuilds every handler) on
+# importlib.reload() or when the module is imported under a second name.
+if not structlog.is_configured():
+    configure_logging(get_logging_settings())
 
 
 def get_logger(name: str) -> BoundLogger:
@@ -1,19 +1,28 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy import text
 
 from app.db.session import shutdown
-from app.dependencies import DB
+from app.dependencies import ReadDB
 from app.exceptions import DomainError, NotFoundError
 from app.logging import get_logger
 from app.middleware import RequestIDMiddleware
-from app.schemas.error import ErrorDetail, ErrorResponse
 
 logger = get_logger(__name__)
 
+# Built once at import so every health probe reuses the same statement object —
+# SQLAlchemy's compiled cache and asyncpg's prepared statement cache both hit.
+_HEALTH_STMT = text("SELECT 1")
+
+# The 500 body never varies, so it's encoded once at import instead of per error.
+_INTERNAL_ERROR_BODY = orjson.dumps(
+    {"error": {"code": "internal_error", "message": "Internal server error"}}
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -26,48 +35,64 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await shutdown()
 
 
-app = FastAPI(lifespan=lifespan)
+# ORJSONResponse serializes with orjson (Rust) instead of stdlib json for every endpoint.
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(RequestIDMiddleware)
 
 
-def _error_json(code: str, message: str) -> dict[str, object]:
-    """Build the standard error envelope as a dict for JSONResponse."""
-    return ErrorResponse(error=ErrorDetail(code=code, message=message)).model_dump()
+def _error_response(status_code: int, code: str, message: str) -> ORJSONResponse:
+    """Build the standard error envelope (shape documented by ErrorResponse)."""
+    return ORJSONResponse(
+        status_code=status_code,
+        content={"error": {"code": code, "message": message}},
+    )
 
 
 @app.exception_handler(NotFoundError)
-async def not_found_handler(request: Request, exc: NotFoundError) -> JSONResponse:
+async def not_found_handler(request: Request, exc: NotFoundError) -> ORJSONResponse:
     """Return 404 with the entity details."""
-    return JSONResponse(status_code=404, content=_error_json("not_found", exc.message))
+    return _error_response(404, "not_found", exc.message)
 
 
 @app.exception_handler(DomainError)
-async def domain_error_handler(request: Request, exc: DomainError) -> JSONResponse:
+async def domain_error_handler(request: Request, exc: DomainError) -> ORJSONResponse:
     """Return 400 for generic domain-level violations."""
     logger.warning("domain_error", error=exc.message, path=request.url.path)
-    return JSONResponse(status_code=400, content=_error_json("domain_error", exc.message))
+    return _error_response(400, "domain_error", exc.message)
 
 
 @app.exception_handler(Exception)
-async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
     """Log unhandled exceptions and return a safe error response.
 
     - Logs full exception with traceback (includes request_id from context)
     - Returns generic error to client (no stack traces leaked)
     """
     logger.exception("unhandled_exception", path=request.url.path, method=request.method)
-    return JSONResponse(
+    return Response(
+        content=_INTERNAL_ERROR_BODY,
         status_code=500,
-        content=_error_json("internal_error", "Internal server error"),
+        media_type="application/json",
     )
 
 
-@app.get("/health")
-async def health(db: DB) -> dict[str, str]:
-    """Health check endpoint — verifies database connectivity.
+@app.get("/health/live")
+async def health_live() -> dict[str, str]:
+    """Liveness probe — the process is up and serving requests.
+
+    Never touches the database, so probes don't take a pool slot or open a
+    transaction. Point orchestrator liveness checks (k8s ``livenessProbe``) here.
+    """
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+async def health_ready(db: ReadDB) -> dict[str, str]:
+    """Readiness probe — verifies database connectivity.
 
     Returns 200 OK only if the database responds to a ping query.
-    Used by load balancers and container orchestrators to detect unhealthy instances.
+    Used by load balancers and container orchestrators (k8s ``readinessProbe``)
+    to stop routing traffic to instances that can't reach the database.
     """
-    await db.execute(text("SELECT 1"))
+    await db.execute(_HEALTH_STMT)
     return {"status": "ok"}
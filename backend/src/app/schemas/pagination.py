@@ -1,10 +1,12 @@
 """Generic pagination types shared by all list endpoints.
 
-PaginatedResponse[T] — Pydantic model for HTTP responses (serializable).
-Paginated[T]         — plain dataclass for service-layer returns (not serializable).
+PaginatedResponse[T]     — Pydantic model for HTTP responses (serializable).
+PaginatedResponseDict[T] — TypedDict of the same shape, for hand-built payloads.
+Paginated[T]             — plain dataclass for service-layer returns (not serializable).
 """
 
 from dataclasses import dataclass
+from typing import TypedDict
 
 from pydantic import BaseModel
 
@@ -22,7 +24,9 @@ class PaginatedResponse[T](BaseModel):
         DealListResponse = PaginatedResponse[DealResponse]
 
     Use this in **routers** (the HTTP boundary). Don't use it inside services
-    or repositories — those layers shouldn't depend on Pydantic.
+    or repositories — those layers shouldn't depend on Pydantic. List routes
+    return a plain-dict payload and reference the model only to document the
+    shape: ``responses={200: {"model": DealListResponse}}``.
     """
 
     model_config = {"from_attributes": True}
@@ -33,7 +37,33 @@ class PaginatedResponse[T](BaseModel):
     limit: int
 
 
-@dataclass
+class PaginatedResponseDict[T](TypedDict):
+    """Typed plain-dict twin of ``PaginatedResponse`` for list routes.
+
+    List routes skip Pydantic and serialize a dict with orjson, so nothing
+    checks the payload at runtime. Annotating it with this TypedDict (and a
+    per-entity TypedDict for ``T``) lets mypy catch a missing or misspelled
+    key instead::
+
+        # routers/deal.py
+        def _page_payload(result: Paginated[Deal]) -> PaginatedResponseDict[DealDict]:
+            return {
+                "items": [_deal_payload(deal) for deal in result.items],
+                "total": result.total,
+                "skip": result.skip,
+                "limit": result.limit,
+            }
+
+    It's a ``dict`` at runtime — building one costs nothing extra.
+    """
+
+    items: list[T]
+    total: int
+    skip: int
+    limit: int
+
+
+@dataclass(slots=True)
 class Paginated[T]:
     """Plain dataclass for paginated results inside the service layer.
 
@@ -43,14 +73,14 @@ class Paginated[T]:
 
         # services/deal.py
         async def get_deals(db, skip, limit) -> Paginated[Deal]:
-            items = await list_deals(db, skip, limit)
-            total = await count_deals(db)
+            items, total = await list_deals(db, skip, limit)  # one round-trip
             return Paginated(items=items, total=total, skip=skip, limit=limit)
 
-    The router then converts it to the Pydantic version for the response::
+    The router then turns it into the response payload::
 
         result = await get_deals(db, skip, limit)
-        return DealListResponse.model_validate(result)
+        payload = {"items": [...], "total": result.total, ...}
+        return Response(orjson.dumps(payload, option=orjson.OPT_UTC_Z), ...)
     """
 
     items: list[T]
@@ -1,11 +1,11 @@
 from collections.abc import AsyncIterator
 
 import pytest_asyncio
+import structlog
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from app.db.session import Base, get_db
+from app.db.session import Base, get_db, get_db_readonly, register_type_codecs
 from app.main import app
 
 # Pytest only picks up fixtures from conftest.py files. Fixtures defined in other
@@ -13,24 +13,46 @@ from app.main import app
 # A plain `import tests.seeds` won't work — pytest_plugins is the way to do it.
 pytest_plugins = ["tests.seeds"]
 
+# Cached loggers keep the processors they were first used with, which would
+# bypass structlog.testing.capture_logs() in any test that runs after them
+structlog.configure(cache_logger_on_first_use=False)
+
 # Separate Postgres database for tests — created by docker/init-test-db.sql on first startup
 TEST_DATABASE_URL = "postgresql+asyncpg://super@localhost:5432/super_test"
 
-engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
-async_session = async_sessionmaker(engine, expire_on_commit=False)
+# A small pool instead of NullPool: tests reuse connections instead of paying a
+# connect + auth handshake each time. Safe because every test and fixture runs
+# on the one session-wide event loop (see pyproject.toml)
+engine = create_async_engine(TEST_DATABASE_URL, pool_size=5, max_overflow=0)
+# Same numeric decoding as the app engine, so tests see what production returns
+register_type_codecs(engine)
 
 
-@pytest_asyncio.fixture
-async def db() -> AsyncIterator[AsyncSession]:
-    """Create tables and yield a session, then drop tables after test."""
+@pytest_asyncio.fixture(scope="session")
+async def schema() -> AsyncIterator[None]:
+    """Create tables once for the whole run, drop them at the end."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
-
-    async with async_session() as session:
-        yield session
-
+    yield
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(schema: None) -> AsyncIterator[AsyncSession]:
+    """Yield a session inside a transaction that is rolled back after the test."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        # commit() in a test (or in code under test) only releases a SAVEPOINT,
+        # so the outer rollback still discards everything the test wrote
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        ) as session:
+            yield session
+        await trans.rollback()
 
 
 @pytest_asyncio.fixture
@@ -41,6 +63,7 @@ async def client(db: AsyncSession) -> AsyncIterator[AsyncClient]:
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db_readonly] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -0,0 +1,44 @@
+import pytest
+from starlette.requests import Request
+
+from app.exceptions import DomainError, NotFoundError
+from app.main import domain_error_handler, not_found_handler, unhandled_exception_handler
+from app.schemas.error import ErrorResponse
+
+# Handlers build the envelope as a plain dict (no Pydantic on the error path).
+# These tests pin that dict to the ErrorResponse schema.
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/books/1", "headers": []})
+
+
+@pytest.mark.asyncio
+async def test_not_found_handler_matches_error_schema() -> None:
+    response = await not_found_handler(_request(), NotFoundError("Book", 1))
+
+    assert response.status_code == 404
+    body = ErrorResponse.model_validate_json(bytes(response.body))
+    assert body.error.code == "not_found"
+    assert body.error.message == "Book with id 1 not found"
+
+
+@pytest.mark.asyncio
+async def test_domain_error_handler_matches_error_schema() -> None:
+    response = await domain_error_handler(_request(), DomainError("Invalid dates"))
+
+    assert response.status_code == 400
+    body = ErrorResponse.model_validate_json(bytes(response.body))
+    assert body.error.code == "domain_error"
+    assert body.error.message == "Invalid dates"
+
+
+@pytest.mark.asyncio
+async def test_unhandled_exception_handler_matches_error_schema() -> None:
+    response = await unhandled_exception_handler(_request(), RuntimeError("boom"))
+
+    assert response.status_code == 500
+    assert response.headers["content-type"] == "application/json"
+    body = ErrorResponse.model_validate_json(bytes(response.body))
+    assert body.error.code == "internal_error"
+    assert body.error.message == "Internal server error"
@@ -3,8 +3,16 @@ from httpx import AsyncClient
 
 
 @pytest.mark.asyncio
-async def test_health_returns_ok(client: AsyncClient) -> None:
-    response = await client.get("/health")
+async def test_health_live_returns_ok(client: AsyncClient) -> None:
+    response = await client.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_health_ready_returns_ok(client: AsyncClient) -> None:
+    response = await client.get("/health/ready")
 
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
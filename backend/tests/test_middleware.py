@@ -0,0 +1,47 @@
+import re
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from structlog.contextvars import clear_contextvars, merge_contextvars
+from structlog.testing import capture_logs
+
+from app.main import unhandled_exception_handler
+from app.middleware import RequestIDMiddleware
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_generated_when_missing(client: AsyncClient) -> None:
+    response = await client.get("/health/live")
+
+    assert re.fullmatch(r"[0-9a-f]{16}", response.headers["X-Request-ID"])
+
+
+@pytest.mark.asyncio
+async def test_request_id_from_client_is_echoed(client: AsyncClient) -> None:
+    response = await client.get("/health/live", headers={"X-Request-ID": "abc-123"})
+
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+
+@pytest.mark.asyncio
+async def test_request_id_is_logged_on_unhandled_exception() -> None:
+    # The 500 is logged by ServerErrorMiddleware, outside RequestIDMiddleware —
+    # request_id must still be bound by then
+    boom_app = FastAPI()
+    boom_app.add_middleware(RequestIDMiddleware)
+    boom_app.add_exception_handler(Exception, unhandled_exception_handler)
+
+    @boom_app.get("/boom")
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    clear_contextvars()
+    transport = ASGITransport(app=boom_app, raise_app_exceptions=False)
+    with capture_logs(processors=[merge_contextvars]) as logs:
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/boom", headers={"X-Request-ID": "req-500"})
+
+    assert response.status_code == 500
+    event = next(log for log in logs if log["event"] == "unhandled_exception")
+    assert event["request_id"] == "req-500"
@@ -0,0 +1,17 @@
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+
+@pytest.mark.asyncio
+async def test_numeric_decodes_like_the_app_engine(db: AsyncSession) -> None:
+    result = await db.execute(text("SELECT avg(x) FROM (VALUES (1), (2)) AS t(x)"))
+
+    value = result.scalar_one()
+
+    assert type(value) is (float if settings.db_numeric_as_float else Decimal)
+    assert value == 1.5